@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import csv
+import os
 import statistics
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import replace
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, TextIO, Tuple
 
-from src.misinformation_ca import MisinformationCA, SimulationConfig, summarize_history
+import numpy as np
+
+from src.misinformation_ca import MisinformationBatchCA, SimulationConfig
 
 OUTPUT_DIR = Path("outputs") / "misinformation"
 RUNS_FILE = OUTPUT_DIR / "misinformation_runs.csv"
@@ -41,6 +46,12 @@ SUMMARY_METRICS = [
     "total_exposure",
 ]
 
+RUNS_FIELDS = ["scenario", "rep", "seed"] + SUMMARY_METRICS
+AGGREGATE_FIELDS = ["scenario"] + [
+    f"{metric}_{stat}" for metric in SUMMARY_METRICS for stat in ("mean", "std")
+]
+TIMESERIES_FIELDS = ["scenario", "step", "mean_believer_ratio", "mean_corrected_ratio"]
+
 
 def base_config() -> SimulationConfig:
     return SimulationConfig(
@@ -62,62 +73,93 @@ def _stddev(values: List[float]) -> float:
     return statistics.stdev(values) if len(values) > 1 else 0.0
 
 
+ScenarioTask = Tuple[SimulationConfig, List[int]]
+
+
+def _run_scenario(
+    task: ScenarioTask,
+) -> Tuple[np.ndarray, np.ndarray, List[Dict[str, float]]]:
+    config, seeds = task
+    sim = MisinformationBatchCA(config, seeds=seeds)
+    believer_traj, corrected_traj = sim.run_trajectory()
+    return believer_traj, corrected_traj, sim.summaries()
+
+
+class _CsvStream:
+    """CSV file whose rows are written and synced to disk as soon as they are produced."""
+
+    def __init__(self, fp: TextIO, fieldnames: List[str]) -> None:
+        self._fp = fp
+        self._writer = csv.DictWriter(fp, fieldnames=fieldnames)
+        self._writer.writeheader()
+
+    def write(self, rows: List[Dict[str, float]]) -> None:
+        self._writer.writerows(rows)
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+
+
+def _open_csv(stack: ExitStack, path: Path, fieldnames: List[str]) -> _CsvStream:
+    fp = stack.enter_context(path.open("w", newline="", encoding="utf-8"))
+    return _CsvStream(fp, fieldnames)
+
+
 def run_all_experiments() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    all_runs: List[Dict[str, float]] = []
     aggregate_rows: List[Dict[str, float]] = []
-    timeseries_rows: List[Dict[str, float]] = []
-
-    scenario_names = list(SCENARIOS.keys())
-    for scenario_index, scenario_name in enumerate(scenario_names):
-        overrides = SCENARIOS[scenario_name]
-        scenario_runs: List[Dict[str, float]] = []
-        scenario_history_buffer: List[List[Dict[str, float]]] = []
-
-        for rep in range(REPETITIONS):
-            seed = BASE_SEED + scenario_index * 1000 + rep
-            config = replace(base_config(), seed=seed, **overrides)
-            sim = MisinformationCA(config)
-            history = sim.run()
-            summary = summarize_history(history)
-            run_row: Dict[str, float] = {
-                "scenario": scenario_name,
-                "rep": rep,
-                "seed": seed,
-                **summary,
-            }
-            scenario_runs.append(run_row)
-            scenario_history_buffer.append(history)
-            all_runs.append(run_row)
-
-        # Mean trajectory by step for selected ratios.
-        steps = len(scenario_history_buffer[0])
-        for step in range(steps):
-            believer_vals = [
-                run_history[step]["believer_ratio"] for run_history in scenario_history_buffer
-            ]
-            corrected_vals = [
-                run_history[step]["corrected_ratio"] for run_history in scenario_history_buffer
+
+    # All repetitions of a scenario are stepped together as one batch, and the
+    # independent scenarios are spread across processes.
+    base = base_config()
+    scenario_seeds = {
+        scenario_name: [BASE_SEED + scenario_index * 1000 + rep for rep in range(REPETITIONS)]
+        for scenario_index, scenario_name in enumerate(SCENARIOS)
+    }
+    tasks: List[ScenarioTask] = [
+        (replace(base, **overrides), scenario_seeds[scenario_name])
+        for scenario_name, overrides in SCENARIOS.items()
+    ]
+
+    with ExitStack() as stack, ProcessPoolExecutor() as executor:
+        runs_csv = _open_csv(stack, RUNS_FILE, RUNS_FIELDS)
+        aggregate_csv = _open_csv(stack, AGGREGATE_FILE, AGGREGATE_FIELDS)
+        timeseries_csv = _open_csv(stack, TIMESERIES_FILE, TIMESERIES_FIELDS)
+
+        # Each scenario's rows are written as soon as its batch finishes, so only one
+        # scenario's (REPETITIONS, steps + 1) trajectories are held at a time.
+        results = executor.map(_run_scenario, tasks)
+        for scenario_name, (believer_traj, corrected_traj, summaries) in zip(SCENARIOS, results):
+            seeds = scenario_seeds[scenario_name]
+            scenario_runs: List[Dict[str, float]] = [
+                {"scenario": scenario_name, "rep": rep, "seed": seed, **summary}
+                for rep, (seed, summary) in enumerate(zip(seeds, summaries))
             ]
-            timeseries_rows.append(
-                {
-                    "scenario": scenario_name,
-                    "step": step,
-                    "mean_believer_ratio": statistics.mean(believer_vals),
-                    "mean_corrected_ratio": statistics.mean(corrected_vals),
-                }
+            runs_csv.write(scenario_runs)
+
+            # Mean trajectory by step for selected ratios. Summing the integer counts is
+            # exact, so each mean is a single correctly rounded division.
+            cells_per_step = len(seeds) * base.width * base.height
+            believer_totals = believer_traj.sum(axis=0).tolist()
+            corrected_totals = corrected_traj.sum(axis=0).tolist()
+            timeseries_csv.write(
+                [
+                    {
+                        "scenario": scenario_name,
+                        "step": step,
+                        "mean_believer_ratio": believer_totals[step] / cells_per_step,
+                        "mean_corrected_ratio": corrected_totals[step] / cells_per_step,
+                    }
+                    for step in range(len(believer_totals))
+                ]
             )
 
-        aggregate_row: Dict[str, float] = {"scenario": scenario_name}
-        for metric in SUMMARY_METRICS:
-            values = [float(row[metric]) for row in scenario_runs]
-            aggregate_row[f"{metric}_mean"] = statistics.mean(values)
-            aggregate_row[f"{metric}_std"] = _stddev(values)
-        aggregate_rows.append(aggregate_row)
-
-    _write_runs_csv(all_runs)
-    _write_aggregate_csv(aggregate_rows)
-    _write_timeseries_csv(timeseries_rows)
+            aggregate_row: Dict[str, float] = {"scenario": scenario_name}
+            for metric in SUMMARY_METRICS:
+                values = [float(row[metric]) for row in scenario_runs]
+                aggregate_row[f"{metric}_mean"] = statistics.mean(values)
+                aggregate_row[f"{metric}_std"] = _stddev(values)
+            aggregate_csv.write([aggregate_row])
+            aggregate_rows.append(aggregate_row)
 
     print("Experimentos concluídos.")
     for row in aggregate_rows:
@@ -131,32 +173,5 @@ def run_all_experiments() -> None:
     print(f"Arquivos salvos em: {OUTPUT_DIR}")
 
 
-def _write_runs_csv(rows: List[Dict[str, float]]) -> None:
-    fieldnames = ["scenario", "rep", "seed"] + SUMMARY_METRICS
-    with RUNS_FILE.open("w", newline="", encoding="utf-8") as fp:
-        writer = csv.DictWriter(fp, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-
-def _write_aggregate_csv(rows: List[Dict[str, float]]) -> None:
-    fieldnames = ["scenario"]
-    for metric in SUMMARY_METRICS:
-        fieldnames.append(f"{metric}_mean")
-        fieldnames.append(f"{metric}_std")
-    with AGGREGATE_FILE.open("w", newline="", encoding="utf-8") as fp:
-        writer = csv.DictWriter(fp, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-
-def _write_timeseries_csv(rows: List[Dict[str, float]]) -> None:
-    fieldnames = ["scenario", "step", "mean_believer_ratio", "mean_corrected_ratio"]
-    with TIMESERIES_FILE.open("w", newline="", encoding="utf-8") as fp:
-        writer = csv.DictWriter(fp, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-
 if __name__ == "__main__":
     run_all_experiments()
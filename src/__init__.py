@@ -1,5 +1,19 @@
 """Cellular automata models for applied simulations."""
 
-from .misinformation_ca import CellState, MisinformationCA, SimulationConfig, summarize_history
+from .misinformation_ca import (
+    CellState,
+    MisinformationBatchCA,
+    MisinformationCA,
+    SimulationConfig,
+    summarize_history,
+    summarize_trajectory,
+)
 
-__all__ = ["CellState", "MisinformationCA", "SimulationConfig", "summarize_history"]
+__all__ = [
+    "CellState",
+    "MisinformationBatchCA",
+    "MisinformationCA",
+    "SimulationConfig",
+    "summarize_history",
+    "summarize_trajectory",
+]
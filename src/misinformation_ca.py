@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import IntEnum
-from random import Random
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 class CellState(IntEnum):
@@ -27,36 +29,183 @@ class SimulationConfig:
     seed: Optional[int] = None
 
 
-def _clamp_probability(value: float) -> float:
-    return max(0.0, min(1.0, value))
+# Plain-int state codes for the array kernels; CellState is kept for the public API.
+_UNAWARE = int(CellState.UNAWARE)
+_BELIEVER = int(CellState.BELIEVER)
+_CORRECTED = int(CellState.CORRECTED)
+
+_NEIGHBOR_OFFSETS = tuple(
+    (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if not (dr == 0 and dc == 0)
+)
+
+# Contribution of each state to a packed neighbor count: believers in the low nibble,
+# corrected in the high nibble.
+_NEIGHBOR_WEIGHT = np.array([0, 0x01, 0x10], dtype=np.uint8)
+
+# State a cell moves to when its transition fires, indexed by its current state.
+_TARGET_STATE = np.array([_BELIEVER, _CORRECTED, _BELIEVER], dtype=np.uint8)
+
+
+@lru_cache(maxsize=128)
+def _transition_table(
+    belief_spread_rate: float,
+    factcheck_rate: float,
+    peer_correction_rate: float,
+    relapse_rate: float,
+) -> np.ndarray:
+    """Return P(leave state) indexed by [state, total_neighbors, packed_counts].
+
+    ``packed_counts`` holds the believer neighbor count in its low nibble and the
+    corrected neighbor count in its high nibble (see ``_NEIGHBOR_WEIGHT``). Tables are
+    cached (up to 128 sets of rates) and shared read-only between simulations.
+    """
+    packed = np.arange(256)
+    totals = np.arange(9)[:, None]
+    believer_ratio = np.divide(packed & 0x0F, totals, out=np.zeros((9, 256)), where=totals > 0)
+    corrected_ratio = np.divide(packed >> 4, totals, out=np.zeros((9, 256)), where=totals > 0)
+
+    table = np.empty((3, 9, 256), dtype=np.float32)
+    table[_UNAWARE] = np.clip(belief_spread_rate * believer_ratio, 0.0, 1.0)
+    table[_BELIEVER] = np.clip(
+        factcheck_rate + peer_correction_rate * corrected_ratio, 0.0, 1.0
+    )
+    table[_CORRECTED] = np.clip(relapse_rate * believer_ratio, 0.0, 1.0)
+    table.flags.writeable = False
+    return table
+
+
+def _validate_config(config: SimulationConfig) -> None:
+    if config.width <= 0 or config.height <= 0:
+        raise ValueError("width and height must be positive.")
+    if config.steps < 0:
+        raise ValueError("steps must be non-negative.")
+    if config.initial_believer_density < 0 or config.initial_corrected_density < 0:
+        raise ValueError("Initial densities must be non-negative.")
+    if config.initial_believer_density + config.initial_corrected_density > 1:
+        raise ValueError("Initial densities cannot sum to more than 1.")
+
+
+def _random_grid(config: SimulationConfig, rng: np.random.Generator) -> np.ndarray:
+    p_believer = config.initial_believer_density
+    p_corrected = config.initial_corrected_density
+    draws = rng.random((config.height, config.width))
+    grid = np.full(draws.shape, _UNAWARE, dtype=np.uint8)
+    grid[draws < p_believer + p_corrected] = _CORRECTED
+    grid[draws < p_believer] = _BELIEVER
+    return grid
+
+
+class _TransitionKernel:
+    """Synchronous update rule for grids of shape ``(..., height, width)``.
+
+    Holds the halo buffer and per-step scratch arrays so a step allocates no
+    full-grid temporaries. Callers fill ``rand`` with uniform draws, then call
+    ``find_moves`` followed by ``apply_moves`` on the same grid.
+    """
+
+    def __init__(self, config: SimulationConfig, shape: Tuple[int, ...]) -> None:
+        self.toroidal = config.toroidal
+        height, width = shape[-2:]
+        self._padded = np.zeros(shape[:-2] + (height + 2, width + 2), dtype=np.uint8)
+        # Views of the halo buffer, one per neighbor offset, built once and reused every step.
+        self._neighbor_views = tuple(
+            self._padded[..., 1 + dr : 1 + dr + height, 1 + dc : 1 + dc + width]
+            for dr, dc in _NEIGHBOR_OFFSETS
+        )
+        # Single precision is ample for Bernoulli draws and halves the memory traffic.
+        self.rand = np.empty(shape, dtype=np.float32)
+        self._packed_states = np.empty(shape, dtype=np.uint8)
+        self._packed_counts = np.empty(shape, dtype=np.uint8)
+        self._table_index = np.empty(shape, dtype=np.uint16)
+        self._probabilities = np.empty(shape, dtype=np.float32)
+        self._moved = np.empty(shape, dtype=bool)
+        self._targets = np.empty(shape, dtype=np.uint8)
+        self._neighbor_totals = self.neighbor_counts(np.ones(shape, dtype=np.uint8))
+        self._transition_table = _transition_table(
+            config.belief_spread_rate,
+            config.factcheck_rate,
+            config.peer_correction_rate,
+            config.relapse_rate,
+        )
+        # With every transition probability at zero no grid can ever change.
+        self.is_static = not self._transition_table.any()
+
+    def neighbor_counts(self, mask: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return, for every cell, how many of its Moore neighbors are set in ``mask``.
+
+        The mask is copied into a cached halo buffer (wrapped for toroidal grids,
+        zero for bounded ones) and the eight precomputed shifted views are added
+        in place.
+        """
+        padded = self._padded
+        padded[..., 1:-1, 1:-1] = mask
+        if self.toroidal:
+            padded[..., 0, 1:-1] = mask[..., -1, :]
+            padded[..., -1, 1:-1] = mask[..., 0, :]
+            padded[..., 0] = padded[..., -2]
+            padded[..., -1] = padded[..., 1]
+
+        if out is None:
+            out = np.zeros(mask.shape, dtype=np.uint8)
+        else:
+            out.fill(0)
+        for neighbor_view in self._neighbor_views:
+            out += neighbor_view
+        return out
+
+    def find_moves(self, grid: np.ndarray) -> np.ndarray:
+        """Return the mask of cells whose transition fires, given the draws in ``rand``."""
+        # One neighbor pass counts both states: at most 8 neighbors fit in each nibble.
+        packed_states = np.take(_NEIGHBOR_WEIGHT, grid, out=self._packed_states)
+        packed_counts = self.neighbor_counts(packed_states, out=self._packed_counts)
+
+        # Flat index into the (3, 9, 256) table, built in place.
+        index = self._table_index
+        index[...] = grid
+        index *= 9
+        index += self._neighbor_totals
+        index <<= 8
+        index += packed_counts
+        probabilities = np.take(self._transition_table, index, out=self._probabilities)
+        return np.less(self.rand, probabilities, out=self._moved)
+
+    def apply_moves(self, grid: np.ndarray) -> None:
+        targets = np.take(_TARGET_STATE, grid, out=self._targets)
+        # find_moves only read the current grid, so it can be updated in place.
+        np.copyto(grid, targets, where=self._moved)
 
 
 class MisinformationCA:
-    """2D stochastic cellular automaton for misinformation dynamics."""
+    """2D stochastic cellular automaton for misinformation dynamics.
+
+    State counts and summary statistics are tracked incrementally while stepping and
+    are resynchronized from ``grid`` whenever ``run`` or ``run_trajectory`` starts;
+    edit ``grid`` only between runs, not between ``advance`` calls.
+    """
 
     def __init__(
         self, config: SimulationConfig, initial_grid: Optional[List[List[int]]] = None
     ) -> None:
         self.config = config
-        self._validate_config()
-        self._rng = Random(config.seed)
+        _validate_config(config)
+        self._rng = np.random.default_rng(config.seed)
         self.time_step = 0
         if initial_grid is None:
-            self.grid = self._build_initial_grid()
+            self.grid = _random_grid(config, self._rng)
         else:
             self.grid = self._normalize_grid(initial_grid)
-
-    def _validate_config(self) -> None:
-        if self.config.width <= 0 or self.config.height <= 0:
-            raise ValueError("width and height must be positive.")
-        if self.config.steps < 0:
-            raise ValueError("steps must be non-negative.")
-        if self.config.initial_believer_density < 0 or self.config.initial_corrected_density < 0:
-            raise ValueError("Initial densities must be non-negative.")
-        if self.config.initial_believer_density + self.config.initial_corrected_density > 1:
-            raise ValueError("Initial densities cannot sum to more than 1.")
-
-    def _normalize_grid(self, initial_grid: List[List[int]]) -> List[List[int]]:
+        self._kernel = _TransitionKernel(config, self.grid.shape)
+        self._sync_tracking()
+
+    def _sync_tracking(self) -> None:
+        """Recount the grid; before the first step, also restart the summary statistics."""
+        _, self._believer_count, self._corrected_count = self._state_counts()
+        if self.time_step == 0:
+            self._peak_ratio = self._believer_count / self.grid.size
+            self._peak_step = 0
+            self._total_exposure = self._peak_ratio
+
+    def _normalize_grid(self, initial_grid: List[List[int]]) -> np.ndarray:
         if len(initial_grid) != self.config.height:
             raise ValueError("Provided grid height does not match config.height.")
         normalized: List[List[int]] = []
@@ -65,109 +214,17 @@ class MisinformationCA:
                 raise ValueError("Provided grid width does not match config.width.")
             normalized_row = [int(CellState(cell)) for cell in row]
             normalized.append(normalized_row)
-        return normalized
-
-    def _build_initial_grid(self) -> List[List[int]]:
-        grid: List[List[int]] = []
-        p_believer = self.config.initial_believer_density
-        p_corrected = self.config.initial_corrected_density
-        p_believer_or_corrected = p_believer + p_corrected
-
-        for _ in range(self.config.height):
-            row: List[int] = []
-            for _ in range(self.config.width):
-                draw = self._rng.random()
-                if draw < p_believer:
-                    row.append(int(CellState.BELIEVER))
-                elif draw < p_believer_or_corrected:
-                    row.append(int(CellState.CORRECTED))
-                else:
-                    row.append(int(CellState.UNAWARE))
-            grid.append(row)
-        return grid
-
-    def _neighbor_positions(self, row: int, col: int) -> List[tuple[int, int]]:
-        neighbors: List[tuple[int, int]] = []
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                nr, nc = row + dr, col + dc
-                if self.config.toroidal:
-                    nr %= self.config.height
-                    nc %= self.config.width
-                    neighbors.append((nr, nc))
-                elif 0 <= nr < self.config.height and 0 <= nc < self.config.width:
-                    neighbors.append((nr, nc))
-        return neighbors
-
-    def _count_neighbor_states(self, row: int, col: int) -> Dict[str, int]:
-        believer_count = 0
-        corrected_count = 0
-        neighbors = self._neighbor_positions(row, col)
-
-        for nr, nc in neighbors:
-            state = self.grid[nr][nc]
-            if state == int(CellState.BELIEVER):
-                believer_count += 1
-            elif state == int(CellState.CORRECTED):
-                corrected_count += 1
-
-        return {
-            "believers": believer_count,
-            "corrected": corrected_count,
-            "total_neighbors": len(neighbors),
-        }
+        return np.array(normalized, dtype=np.uint8)
 
-    def _transition(self, row: int, col: int, current_state: int) -> int:
-        counts = self._count_neighbor_states(row, col)
-        total_neighbors = counts["total_neighbors"]
-        believer_ratio = counts["believers"] / total_neighbors if total_neighbors else 0.0
-        corrected_ratio = counts["corrected"] / total_neighbors if total_neighbors else 0.0
-
-        if current_state == int(CellState.UNAWARE):
-            spread_probability = _clamp_probability(
-                self.config.belief_spread_rate * believer_ratio
-            )
-            if self._rng.random() < spread_probability:
-                return int(CellState.BELIEVER)
-            return int(CellState.UNAWARE)
-
-        if current_state == int(CellState.BELIEVER):
-            correction_probability = _clamp_probability(
-                self.config.factcheck_rate
-                + self.config.peer_correction_rate * corrected_ratio
-            )
-            if self._rng.random() < correction_probability:
-                return int(CellState.CORRECTED)
-            return int(CellState.BELIEVER)
-
-        if current_state == int(CellState.CORRECTED):
-            relapse_probability = _clamp_probability(
-                self.config.relapse_rate * believer_ratio
-            )
-            if self._rng.random() < relapse_probability:
-                return int(CellState.BELIEVER)
-            return int(CellState.CORRECTED)
-
-        raise ValueError(f"Unknown cell state: {current_state}")
+    def _state_counts(self) -> Tuple[int, int, int]:
+        counts = np.bincount(self.grid.ravel(), minlength=3)
+        if len(counts) > 3:
+            unknown = self.grid[self.grid > _CORRECTED][0]
+            raise ValueError(f"Unknown cell state in grid: {unknown}")
+        return int(counts[_UNAWARE]), int(counts[_BELIEVER]), int(counts[_CORRECTED])
 
     def snapshot(self) -> Dict[str, float]:
-        unaware_count = 0
-        believer_count = 0
-        corrected_count = 0
-
-        for row in self.grid:
-            for cell in row:
-                if cell == int(CellState.UNAWARE):
-                    unaware_count += 1
-                elif cell == int(CellState.BELIEVER):
-                    believer_count += 1
-                elif cell == int(CellState.CORRECTED):
-                    corrected_count += 1
-                else:
-                    raise ValueError(f"Unknown cell state in grid: {cell}")
-
+        unaware_count, believer_count, corrected_count = self._state_counts()
         total_cells = self.config.width * self.config.height
         return {
             "step": self.time_step,
@@ -179,28 +236,33 @@ class MisinformationCA:
             "corrected_ratio": corrected_count / total_cells,
         }
 
-    def advance(self) -> Dict[str, float]:
-        next_grid: List[List[int]] = []
-        new_believers = 0
-        new_corrected = 0
-        relapses = 0
-
-        for row in range(self.config.height):
-            next_row: List[int] = []
-            for col in range(self.config.width):
-                old_state = self.grid[row][col]
-                new_state = self._transition(row, col, old_state)
-                if old_state == int(CellState.UNAWARE) and new_state == int(CellState.BELIEVER):
-                    new_believers += 1
-                elif old_state == int(CellState.BELIEVER) and new_state == int(CellState.CORRECTED):
-                    new_corrected += 1
-                elif old_state == int(CellState.CORRECTED) and new_state == int(CellState.BELIEVER):
-                    relapses += 1
-                next_row.append(new_state)
-            next_grid.append(next_row)
-
-        self.grid = next_grid
+    def _step(self) -> Tuple[int, int, int]:
+        """Apply one synchronous update and return (new_believers, new_corrected, relapses)."""
+        self._rng.random(dtype=np.float32, out=self._kernel.rand)
+        moved = self._kernel.find_moves(self.grid)
+        from_states = np.bincount(self.grid[moved], minlength=3)
+        self._kernel.apply_moves(self.grid)
         self.time_step += 1
+
+        new_believers = int(from_states[_UNAWARE])
+        new_corrected = int(from_states[_BELIEVER])
+        relapses = int(from_states[_CORRECTED])
+        self._believer_count += new_believers + relapses - new_corrected
+        self._corrected_count += new_corrected - relapses
+        believer_ratio = self._believer_count / self.grid.size
+        if believer_ratio > self._peak_ratio:
+            self._peak_ratio = believer_ratio
+            self._peak_step = self.time_step
+        self._total_exposure += believer_ratio
+        return new_believers, new_corrected, relapses
+
+    def _hold(self, steps: int) -> None:
+        """Account for ``steps`` steps of a frozen grid without stepping it."""
+        self.time_step += steps
+        self._total_exposure += steps * self._believer_count / self.grid.size
+
+    def advance(self) -> Dict[str, float]:
+        new_believers, new_corrected, relapses = self._step()
         step_snapshot = self.snapshot()
         step_snapshot["new_believers"] = new_believers
         step_snapshot["new_corrected"] = new_corrected
@@ -208,14 +270,201 @@ class MisinformationCA:
         return step_snapshot
 
     def run(self) -> List[Dict[str, float]]:
+        self._sync_tracking()
         history = [self.snapshot()]
         history[0]["new_believers"] = 0
         history[0]["new_corrected"] = 0
         history[0]["relapses"] = 0
         for _ in range(self.config.steps):
+            if self._is_frozen(self._believer_count):
+                break
             history.append(self.advance())
+
+        # A frozen grid repeats its last snapshot for the remaining steps.
+        while len(history) <= self.config.steps:
+            self._hold(1)
+            frozen_snapshot = dict(history[-1])
+            frozen_snapshot["step"] = self.time_step
+            frozen_snapshot["new_believers"] = 0
+            frozen_snapshot["new_corrected"] = 0
+            frozen_snapshot["relapses"] = 0
+            history.append(frozen_snapshot)
         return history
 
+    def _is_frozen(self, believer_count: int) -> bool:
+        """Return True when no further step can change the grid.
+
+        Every transition needs a believer (as a neighbor, or as the cell itself for
+        fact-checking), so a grid without believers is absorbing; so is any grid
+        whose rates make every transition probability zero.
+        """
+        return believer_count == 0 or self._kernel.is_static
+
+    def run_trajectory(
+        self,
+        believer_out: Optional[np.ndarray] = None,
+        corrected_out: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Run the simulation, recording only the believer and corrected counts per step.
+
+        Unlike ``run`` no per-step dicts are built; the counts are written straight into
+        ``believer_out`` and ``corrected_out`` (length ``steps + 1``) when provided.
+        Integer counts keep means over repetitions exact; divide by the cell count for
+        ratios.
+        """
+        points = self.config.steps + 1
+        if believer_out is None:
+            believer_out = np.empty(points, dtype=np.int64)
+        if corrected_out is None:
+            corrected_out = np.empty(points, dtype=np.int64)
+        if len(believer_out) != points or len(corrected_out) != points:
+            raise ValueError("Output buffers must have length config.steps + 1.")
+
+        self._sync_tracking()
+        for step in range(points):
+            if step:
+                if self._is_frozen(self._believer_count):
+                    believer_out[step:] = believer_out[step - 1]
+                    corrected_out[step:] = corrected_out[step - 1]
+                    self._hold(points - step)
+                    break
+                self._step()
+            believer_out[step] = self._believer_count
+            corrected_out[step] = self._corrected_count
+        return believer_out, corrected_out
+
+    def summary(self) -> Dict[str, float]:
+        """Summarize the run so far, as ``summarize_history`` would for its history."""
+        total_cells = self.grid.size
+        return {
+            "peak_believer_ratio": self._peak_ratio,
+            "time_to_peak": self._peak_step,
+            "final_believer_ratio": self._believer_count / total_cells,
+            "final_corrected_ratio": self._corrected_count / total_cells,
+            "total_exposure": self._total_exposure,
+        }
+
+
+class MisinformationBatchCA:
+    """Independent repetitions of one configuration stepped together as a 3D tensor.
+
+    ``grid`` has shape ``(batch_size, height, width)``. Each repetition draws from its
+    own generator, so repetition ``i`` evolves exactly like ``MisinformationCA`` seeded
+    with ``seeds[i]``. Without explicit seeds, child seeds are spawned from
+    ``config.seed``.
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        batch_size: Optional[int] = None,
+        seeds: Optional[Sequence[int]] = None,
+    ) -> None:
+        self.config = config
+        _validate_config(config)
+        if seeds is None:
+            if batch_size is None or batch_size <= 0:
+                raise ValueError("batch_size must be positive when seeds are not given.")
+            seed_sequences = np.random.SeedSequence(config.seed).spawn(batch_size)
+            self._rngs = [np.random.default_rng(sequence) for sequence in seed_sequences]
+        else:
+            if batch_size is not None and batch_size != len(seeds):
+                raise ValueError("batch_size does not match the number of seeds.")
+            if not seeds:
+                raise ValueError("seeds cannot be empty.")
+            self._rngs = [np.random.default_rng(seed) for seed in seeds]
+        self.batch_size = len(self._rngs)
+        self.time_step = 0
+        self.grid = np.stack([_random_grid(config, rng) for rng in self._rngs])
+        self._kernel = _TransitionKernel(config, self.grid.shape)
+        # Cell values offset by 3 * repetition, so one bincount counts every
+        # (repetition, state) pair at once.
+        self._rep_offsets = 3 * np.arange(self.batch_size, dtype=np.int32)[:, None, None]
+        self._rep_states = np.empty(self.grid.shape, dtype=np.int32)
+        self._sync_tracking()
+
+    def _sync_tracking(self) -> None:
+        """Recount the grid; before the first step, also restart the summary statistics."""
+        self._believer_count, self._corrected_count = self._state_counts()
+        self._believer_ratio = self._believer_count / self.grid[0].size
+        if self.time_step == 0:
+            self._peak_ratio = self._believer_ratio.copy()
+            self._peak_step = np.zeros(self.batch_size, dtype=np.int64)
+            self._total_exposure = self._believer_ratio.copy()
+
+    def _step(self) -> None:
+        for rng, rand in zip(self._rngs, self._kernel.rand):
+            rng.random(dtype=np.float32, out=rand)
+        moved = self._kernel.find_moves(self.grid)
+        from_states = self._count_by_repetition(moved)
+        self._kernel.apply_moves(self.grid)
+        self.time_step += 1
+
+        new_believers = from_states[:, _UNAWARE]
+        new_corrected = from_states[:, _BELIEVER]
+        relapses = from_states[:, _CORRECTED]
+        self._believer_count += new_believers + relapses - new_corrected
+        self._corrected_count += new_corrected - relapses
+        self._believer_ratio = self._believer_count / self.grid[0].size
+        rising = self._believer_ratio > self._peak_ratio
+        self._peak_ratio[rising] = self._believer_ratio[rising]
+        self._peak_step[rising] = self.time_step
+        self._total_exposure += self._believer_ratio
+
+    def _count_by_repetition(self, where: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return a (batch_size, 3) array of state counts, restricted to ``where`` if given."""
+        rep_states = np.add(self.grid, self._rep_offsets, out=self._rep_states)
+        selected = rep_states.ravel() if where is None else rep_states[where]
+        counts = np.bincount(selected, minlength=3 * self.batch_size)
+        return counts.reshape(self.batch_size, 3)
+
+    def _state_counts(self) -> Tuple[np.ndarray, np.ndarray]:
+        counts = self._count_by_repetition()
+        return counts[:, _BELIEVER].copy(), counts[:, _CORRECTED].copy()
+
+    def run_trajectory(
+        self,
+        believer_out: Optional[np.ndarray] = None,
+        corrected_out: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Run every repetition, returning ``(batch_size, steps + 1)`` count arrays."""
+        shape = (self.batch_size, self.config.steps + 1)
+        if believer_out is None:
+            believer_out = np.empty(shape, dtype=np.int64)
+        if corrected_out is None:
+            corrected_out = np.empty(shape, dtype=np.int64)
+        if believer_out.shape != shape or corrected_out.shape != shape:
+            raise ValueError("Output buffers must have shape (batch_size, config.steps + 1).")
+
+        self._sync_tracking()
+        for step in range(shape[1]):
+            if step:
+                # Stop once every repetition is frozen (see MisinformationCA._is_frozen).
+                if self._kernel.is_static or not self._believer_ratio.any():
+                    believer_out[:, step:] = believer_out[:, step - 1 : step]
+                    corrected_out[:, step:] = corrected_out[:, step - 1 : step]
+                    self.time_step += shape[1] - step
+                    self._total_exposure += (shape[1] - step) * self._believer_ratio
+                    break
+                self._step()
+            believer_out[:, step] = self._believer_count
+            corrected_out[:, step] = self._corrected_count
+        return believer_out, corrected_out
+
+    def summaries(self) -> List[Dict[str, float]]:
+        """Summarize each repetition's run so far, in batch order."""
+        total_cells = self.grid[0].size
+        return [
+            {
+                "peak_believer_ratio": float(self._peak_ratio[rep]),
+                "time_to_peak": int(self._peak_step[rep]),
+                "final_believer_ratio": int(self._believer_count[rep]) / total_cells,
+                "final_corrected_ratio": int(self._corrected_count[rep]) / total_cells,
+                "total_exposure": float(self._total_exposure[rep]),
+            }
+            for rep in range(self.batch_size)
+        ]
+
 
 def summarize_history(history: List[Dict[str, float]]) -> Dict[str, float]:
     if not history:
@@ -241,3 +490,21 @@ def summarize_history(history: List[Dict[str, float]]) -> Dict[str, float]:
         "final_corrected_ratio": float(final_step["corrected_ratio"]),
         "total_exposure": total_exposure,
     }
+
+
+def summarize_trajectory(
+    believer_counts: np.ndarray, corrected_counts: np.ndarray, total_cells: int
+) -> Dict[str, float]:
+    """Summarize one run's counts as recorded by ``run_trajectory``, indexed by step."""
+    if len(believer_counts) == 0:
+        raise ValueError("trajectory cannot be empty")
+
+    believer_ratios = [int(count) / total_cells for count in believer_counts]
+    peak_step = int(np.argmax(believer_counts))
+    return {
+        "peak_believer_ratio": believer_ratios[peak_step],
+        "time_to_peak": peak_step,
+        "final_believer_ratio": believer_ratios[-1],
+        "final_corrected_ratio": int(corrected_counts[-1]) / total_cells,
+        "total_exposure": sum(believer_ratios),
+    }
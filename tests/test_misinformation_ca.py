@@ -1,6 +1,14 @@
 import unittest
+from dataclasses import replace
 
-from src.misinformation_ca import CellState, MisinformationCA, SimulationConfig
+from src.misinformation_ca import (
+    CellState,
+    MisinformationBatchCA,
+    MisinformationCA,
+    SimulationConfig,
+    summarize_history,
+    summarize_trajectory,
+)
 
 
 class TransitionRuleTests(unittest.TestCase):
@@ -73,6 +81,29 @@ class TransitionRuleTests(unittest.TestCase):
         sim.advance()
         self.assertEqual(sim.grid[1][1], int(CellState.BELIEVER))
 
+    def test_corner_exposure_uses_existing_neighbors_only(self) -> None:
+        config = SimulationConfig(
+            width=3,
+            height=3,
+            steps=1,
+            initial_believer_density=0.0,
+            initial_corrected_density=0.0,
+            belief_spread_rate=1.0,
+            factcheck_rate=0.0,
+            peer_correction_rate=0.0,
+            relapse_rate=0.0,
+            toroidal=False,
+            seed=1,
+        )
+        initial_grid = [
+            [CellState.UNAWARE, CellState.BELIEVER, CellState.UNAWARE],
+            [CellState.BELIEVER, CellState.BELIEVER, CellState.UNAWARE],
+            [CellState.UNAWARE, CellState.UNAWARE, CellState.UNAWARE],
+        ]
+        sim = MisinformationCA(config, initial_grid=initial_grid)
+        sim.advance()
+        self.assertEqual(sim.grid[0][0], int(CellState.BELIEVER))
+
     def test_zero_rates_keep_grid_stable(self) -> None:
         config = SimulationConfig(
             width=3,
@@ -95,7 +126,86 @@ class TransitionRuleTests(unittest.TestCase):
         sim = MisinformationCA(config, initial_grid=initial_grid)
         initial_int_grid = [[int(cell) for cell in row] for row in initial_grid]
         sim.run()
-        self.assertEqual(sim.grid, initial_int_grid)
+        self.assertEqual(sim.grid.tolist(), initial_int_grid)
+
+    def test_grid_without_believers_is_held_for_remaining_steps(self) -> None:
+        config = SimulationConfig(width=4, height=3, steps=6, seed=5)
+        initial_grid = [
+            [CellState.UNAWARE, CellState.CORRECTED, CellState.UNAWARE, CellState.UNAWARE],
+            [CellState.UNAWARE, CellState.UNAWARE, CellState.CORRECTED, CellState.UNAWARE],
+            [CellState.CORRECTED, CellState.UNAWARE, CellState.UNAWARE, CellState.UNAWARE],
+        ]
+        sim = MisinformationCA(config, initial_grid=initial_grid)
+        rng_state = sim._rng.bit_generator.state
+        history = sim.run()
+
+        # No step was taken, so no random draws were consumed.
+        self.assertEqual(sim._rng.bit_generator.state, rng_state)
+        self.assertEqual([step["step"] for step in history], list(range(config.steps + 1)))
+        self.assertEqual(sim.time_step, config.steps)
+        for snapshot in history[1:]:
+            self.assertEqual(snapshot["corrected_count"], 3)
+            self.assertEqual(snapshot["new_believers"], 0)
+
+    def test_trajectory_stops_stepping_once_believers_die_out(self) -> None:
+        # Certain fact-checking with no spread or relapse clears every believer in one step.
+        config = SimulationConfig(
+            width=6,
+            height=5,
+            steps=8,
+            initial_believer_density=0.3,
+            belief_spread_rate=0.0,
+            factcheck_rate=1.0,
+            relapse_rate=0.0,
+            seed=4,
+        )
+        total_cells = config.width * config.height
+        expected_history = MisinformationCA(config).run()
+        one_step = MisinformationCA(config)
+        one_step._step()
+
+        sim = MisinformationCA(config)
+        believer, corrected = sim.run_trajectory()
+        self.assertGreater(believer[0], 0)
+        self.assertEqual(believer[1:].tolist(), [0] * config.steps)
+        self.assertEqual(corrected[1:].tolist(), [corrected[1]] * config.steps)
+        self.assertEqual(sim.time_step, config.steps)
+        self.assertEqual(sim._rng.bit_generator.state, one_step._rng.bit_generator.state)
+        self.assertEqual(sim.summary(), summarize_history(expected_history))
+        self.assertEqual(summarize_trajectory(believer, corrected, total_cells), sim.summary())
+
+        batch = MisinformationBatchCA(config, seeds=[4, 5])
+        batch_believer, _ = batch.run_trajectory()
+        self.assertEqual(batch_believer[:, 1:].tolist(), [[0] * config.steps] * 2)
+        self.assertEqual(batch.time_step, config.steps)
+        self.assertEqual(batch._rngs[0].bit_generator.state, one_step._rng.bit_generator.state)
+        self.assertEqual(batch.summaries()[0], sim.summary())
+
+    def test_static_rates_hold_believers_and_accumulate_exposure(self) -> None:
+        config = SimulationConfig(
+            width=5,
+            height=5,
+            steps=6,
+            initial_believer_density=0.4,
+            belief_spread_rate=0.0,
+            factcheck_rate=0.0,
+            peer_correction_rate=0.0,
+            relapse_rate=0.0,
+            seed=8,
+        )
+        expected = summarize_history(MisinformationCA(config).run())
+        sim = MisinformationCA(config)
+        rng_state = sim._rng.bit_generator.state
+        believer, _ = sim.run_trajectory()
+        batch = MisinformationBatchCA(config, seeds=[8])
+        batch.run_trajectory()
+
+        self.assertEqual(sim._rng.bit_generator.state, rng_state)
+        self.assertEqual(believer.tolist(), [believer[0]] * (config.steps + 1))
+        for summary in (sim.summary(), batch.summaries()[0]):
+            self.assertEqual(summary["time_to_peak"], 0)
+            for metric, value in expected.items():
+                self.assertAlmostEqual(summary[metric], value, places=12)
 
     def test_history_conserves_population(self) -> None:
         config = SimulationConfig(width=10, height=8, steps=5, seed=123)
@@ -117,6 +227,65 @@ class TransitionRuleTests(unittest.TestCase):
             )
             self.assertAlmostEqual(ratio_sum, 1.0, places=6)
 
+    def test_trajectory_matches_history(self) -> None:
+        config = SimulationConfig(width=12, height=9, steps=15, seed=7)
+        history = MisinformationCA(config).run()
+        sim = MisinformationCA(config)
+        believer, corrected = sim.run_trajectory()
+
+        self.assertEqual(believer.tolist(), [step["believer_count"] for step in history])
+        self.assertEqual(corrected.tolist(), [step["corrected_count"] for step in history])
+        expected = summarize_history(history)
+        total_cells = config.width * config.height
+        for summary in (summarize_trajectory(believer, corrected, total_cells), sim.summary()):
+            self.assertEqual(summary, expected)
+
+    def test_summary_follows_grid_edited_before_run(self) -> None:
+        config = SimulationConfig(width=6, height=6, steps=10, seed=3)
+        sim = MisinformationCA(config)
+        sim.grid[:3] = int(CellState.BELIEVER)
+        history = sim.run()
+
+        self.assertEqual(sim.summary(), summarize_history(history))
+
+    def test_batch_repetitions_match_individual_runs(self) -> None:
+        config = SimulationConfig(
+            width=9, height=6, steps=12, initial_believer_density=0.2, toroidal=False
+        )
+        seeds = [11, 12, 13]
+        batch = MisinformationBatchCA(config, seeds=seeds)
+        believer, corrected = batch.run_trajectory()
+
+        self.assertEqual(believer.shape, (len(seeds), config.steps + 1))
+        for rep, seed in enumerate(seeds):
+            expected = MisinformationCA(replace(config, seed=seed)).run_trajectory()
+            self.assertEqual(believer[rep].tolist(), expected[0].tolist())
+            self.assertEqual(corrected[rep].tolist(), expected[1].tolist())
+            summary = summarize_trajectory(*expected, config.width * config.height)
+            for metric, value in batch.summaries()[rep].items():
+                self.assertEqual(value, summary[metric])
+
+    def test_batch_spawns_independent_repetitions_from_config_seed(self) -> None:
+        config = SimulationConfig(width=8, height=8, steps=10, seed=21)
+        first = MisinformationBatchCA(config, batch_size=3).run_trajectory()
+        second = MisinformationBatchCA(config, batch_size=3).run_trajectory()
+
+        self.assertEqual(first[0].shape, (3, config.steps + 1))
+        self.assertEqual(first[0].tolist(), second[0].tolist())
+        self.assertEqual(first[1].tolist(), second[1].tolist())
+        self.assertNotEqual(first[0][0].tolist(), first[0][1].tolist())
+
+    def test_batch_rejects_inconsistent_sizes(self) -> None:
+        config = SimulationConfig(width=4, height=4, steps=1, seed=1)
+        with self.assertRaises(ValueError):
+            MisinformationBatchCA(config)
+        with self.assertRaises(ValueError):
+            MisinformationBatchCA(config, batch_size=0)
+        with self.assertRaises(ValueError):
+            MisinformationBatchCA(config, batch_size=2, seeds=[1, 2, 3])
+        with self.assertRaises(ValueError):
+            MisinformationBatchCA(config, seeds=[])
+
 
 if __name__ == "__main__":
     unittest.main()